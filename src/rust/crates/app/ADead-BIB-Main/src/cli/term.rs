@@ -51,6 +51,11 @@ pub const BG_GREEN: &str = "\x1b[42m";
 pub const BG_YELLOW: &str = "\x1b[43m";
 pub const BG_BLUE: &str = "\x1b[44m";
 
+// Pre-combined styles used by the per-phase helpers (avoids a format! per call)
+const BOLD_BRIGHT_BLUE: &str = "\x1b[1m\x1b[94m";
+const BOLD_BRIGHT_RED: &str = "\x1b[1m\x1b[91m";
+const DIM_GRAY: &str = "\x1b[2m\x1b[90m";
+
 // ---------------------------------------------------------------------------
 // Windows: enable ANSI / virtual-terminal processing
 // ---------------------------------------------------------------------------
@@ -109,7 +114,7 @@ fn wrap(codes: &str, text: &str) -> String {
 
 /// Bold bright-blue header for a compiler phase.
 pub fn phase_header(text: &str) -> String {
-    wrap(&format!("{BOLD}{BRIGHT_BLUE}"), text)
+    wrap(BOLD_BRIGHT_BLUE, text)
 }
 
 /// Bright-green success text.
@@ -124,7 +129,7 @@ pub fn warn(text: &str) -> String {
 
 /// Bold bright-red error text.
 pub fn error_text(text: &str) -> String {
-    wrap(&format!("{BOLD}{BRIGHT_RED}"), text)
+    wrap(BOLD_BRIGHT_RED, text)
 }
 
 /// Cyan informational text.
@@ -134,7 +139,7 @@ pub fn info(text: &str) -> String {
 
 /// Gray / dim text.
 pub fn dim(text: &str) -> String {
-    wrap(&format!("{DIM}{GRAY}"), text)
+    wrap(DIM_GRAY, text)
 }
 
 /// Magenta for token display.
@@ -179,28 +184,24 @@ pub fn phase_bar(phase_num: usize, name: &str, lang: &str) -> String {
 // ASCII Banner — Elegant "ADead-BIB" logo
 // ---------------------------------------------------------------------------
 
-/// Returns the ADead-BIB ASCII art banner with blue coloring.
-/// `lang_tag` is shown after the version (e.g. "C", "C++", "CUDA").
-pub fn banner(lang_tag: &str, version: &str) -> String {
-    let art = r#"
-     _    ____                 _       ____ ___ ____
+const BANNER_ART: &str = r#"     _    ____                 _       ____ ___ ____
     / \  |  _ \  ___  __ _  __| |     | __ )_ _| __ )
    / _ \ | | | |/ _ \/ _` |/ _` |_____|  _ \| ||  _ \
   / ___ \| |_| |  __/ (_| | (_| |_____| |_) | || |_) |
  /_/   \_\____/ \___|\__,_|\__,_|     |____/___|____/
 "#;
 
+const BANNER_BAR: &str = "  ─────────────────────────────────────────────────";
+
+/// Returns the ADead-BIB ASCII art banner with blue coloring.
+/// `lang_tag` is shown after the version (e.g. "C", "C++", "CUDA").
+pub fn banner(lang_tag: &str, version: &str) -> String {
     if is_color_enabled() {
-        let colored_art = format!("{BOLD}{BRIGHT_BLUE}{}{RESET}", art.trim_start_matches('\n'));
-        let info_line = format!(
-            "  {BOLD}{WHITE}v{version}{RESET}  {DIM}{GRAY}[{lang_tag}]{RESET}  {DIM}{GRAY}No LLVM. No GCC. Pure bits.{RESET}"
-        );
-        let bar = format!("{BLUE}  ─────────────────────────────────────────────────{RESET}");
-        format!("{colored_art}\n{info_line}\n{bar}")
+        format!(
+            "{BOLD_BRIGHT_BLUE}{BANNER_ART}{RESET}\n  {BOLD}{WHITE}v{version}{RESET}  {DIM_GRAY}[{lang_tag}]{RESET}  {DIM_GRAY}No LLVM. No GCC. Pure bits.{RESET}\n{BLUE}{BANNER_BAR}{RESET}"
+        )
     } else {
-        let info_line = format!("  v{version}  [{lang_tag}]  No LLVM. No GCC. Pure bits.");
-        let bar = "  ─────────────────────────────────────────────────";
-        format!("{}\n{info_line}\n{bar}", art.trim_start_matches('\n'))
+        format!("{BANNER_ART}\n  v{version}  [{lang_tag}]  No LLVM. No GCC. Pure bits.\n{BANNER_BAR}")
     }
 }
 
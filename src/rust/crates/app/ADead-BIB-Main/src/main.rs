@@ -7,6 +7,7 @@ use crate::driver::cpp_driver;
 use crate::driver::cuda_driver;
 use crate::driver::js_driver;
 use std::env;
+use std::io::{self, Write};
 use std::path::Path;
 use std::process::Command;
 use std::process::ExitCode;
@@ -270,37 +271,45 @@ fn run_executable(output_file: &str) -> Result<ExitCode, Box<dyn std::error::Err
 }
 
 fn print_usage(bin: &str) {
-    println!("{}", term::banner("Multi-Language", VERSION));
-    println!();
-    println!("  {}  {} <command> <file> [options]", term::phase_header("USAGE:"), bin);
-    println!("  {}  {} <file.c|file.cpp>          {}", term::phase_header("SHORT:"), bin, term::dim("(auto-detect)"));
-    println!();
-    println!("  {}", term::phase_header("COMMANDS (Languages):"));
-    println!("    {}   <file.c>     Compile C source (C99/C11)", term::ok("cc  "));
-    println!("    {}   <file.cpp>   Compile C++ source (C++17/20)", term::ok("cxx "));
-    println!("    {}   <file.cu>    Compile CUDA source (preview)", term::info("cuda"));
-    println!("    {}   <file.js>    Compile JavaScript (preview)", term::info("js  "));
-    println!();
-    println!("  {}", term::phase_header("COMMANDS (Actions):"));
-    println!("    {}   <file>       Compile + run (auto-detect language)", term::ok("run "));
-    println!("    {}   <file>       Step mode: show every compiler phase", term::ok("step"));
-    println!("    {}               Show compiler version", term::info("version"));
-    println!("    {}               Show this help", term::info("help"));
-    println!();
-    println!("  {}", term::phase_header("OPTIONS:"));
-    println!("    {}       Output file (default: <basename>.exe)", term::dim("-o <output>"));
-    println!("    {}     Enable step mode (show all phases)", term::dim("-step, --step"));
-    println!("    {}          Strict C mode: bit-widths enforced, all UB = error", term::dim("-Wstrict"));
-    println!("    {}           C++ is always strict (implicit)", term::dim("(C++ note)"));
-    println!();
-    println!("  {}", term::phase_header("EXAMPLES:"));
-    println!("    {} run hello.c                  {}", bin, term::dim("Compile + run C"));
-    println!("    {} run app.cpp                  {}", bin, term::dim("Compile + run C++"));
-    println!("    {} cc hello.c -o out.exe        {}", bin, term::dim("Custom output"));
-    println!("    {} cxx app.cpp -step            {}", bin, term::dim("C++ step mode"));
-    println!("    {} hello.c                      {}", bin, term::dim("Auto-detect C"));
-    println!("    {} app.cpp                      {}", bin, term::dim("Auto-detect C++"));
-    println!();
+    // Lock stdout once and buffer the whole usage screen
+    let stdout = io::stdout();
+    let mut out = io::BufWriter::new(stdout.lock());
+    let _ = write_usage(&mut out, bin);
+}
+
+fn write_usage(out: &mut impl Write, bin: &str) -> io::Result<()> {
+    writeln!(out, "{}", term::banner("Multi-Language", VERSION))?;
+    writeln!(out)?;
+    writeln!(out, "  {}  {} <command> <file> [options]", term::phase_header("USAGE:"), bin)?;
+    writeln!(out, "  {}  {} <file.c|file.cpp>          {}", term::phase_header("SHORT:"), bin, term::dim("(auto-detect)"))?;
+    writeln!(out)?;
+    writeln!(out, "  {}", term::phase_header("COMMANDS (Languages):"))?;
+    writeln!(out, "    {}   <file.c>     Compile C source (C99/C11)", term::ok("cc  "))?;
+    writeln!(out, "    {}   <file.cpp>   Compile C++ source (C++17/20)", term::ok("cxx "))?;
+    writeln!(out, "    {}   <file.cu>    Compile CUDA source (preview)", term::info("cuda"))?;
+    writeln!(out, "    {}   <file.js>    Compile JavaScript (preview)", term::info("js  "))?;
+    writeln!(out)?;
+    writeln!(out, "  {}", term::phase_header("COMMANDS (Actions):"))?;
+    writeln!(out, "    {}   <file>       Compile + run (auto-detect language)", term::ok("run "))?;
+    writeln!(out, "    {}   <file>       Step mode: show every compiler phase", term::ok("step"))?;
+    writeln!(out, "    {}               Show compiler version", term::info("version"))?;
+    writeln!(out, "    {}               Show this help", term::info("help"))?;
+    writeln!(out)?;
+    writeln!(out, "  {}", term::phase_header("OPTIONS:"))?;
+    writeln!(out, "    {}       Output file (default: <basename>.exe)", term::dim("-o <output>"))?;
+    writeln!(out, "    {}     Enable step mode (show all phases)", term::dim("-step, --step"))?;
+    writeln!(out, "    {}          Strict C mode: bit-widths enforced, all UB = error", term::dim("-Wstrict"))?;
+    writeln!(out, "    {}           C++ is always strict (implicit)", term::dim("(C++ note)"))?;
+    writeln!(out)?;
+    writeln!(out, "  {}", term::phase_header("EXAMPLES:"))?;
+    writeln!(out, "    {} run hello.c                  {}", bin, term::dim("Compile + run C"))?;
+    writeln!(out, "    {} run app.cpp                  {}", bin, term::dim("Compile + run C++"))?;
+    writeln!(out, "    {} cc hello.c -o out.exe        {}", bin, term::dim("Custom output"))?;
+    writeln!(out, "    {} cxx app.cpp -step            {}", bin, term::dim("C++ step mode"))?;
+    writeln!(out, "    {} hello.c                      {}", bin, term::dim("Auto-detect C"))?;
+    writeln!(out, "    {} app.cpp                      {}", bin, term::dim("Auto-detect C++"))?;
+    writeln!(out)?;
+    out.flush()
 }
 
 // ── Tests ───────────────────────────────────────────────────
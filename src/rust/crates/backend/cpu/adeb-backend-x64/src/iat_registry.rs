@@ -444,7 +444,8 @@ pub fn slot_for_function(name: &str) -> Option<usize> {
     None
 }
 
-fn align_up(value: usize, align: usize) -> usize {
+#[inline]
+const fn align_up(value: usize, align: usize) -> usize {
     if align == 0 { return value; }
     (value + (align - 1)) & !(align - 1)
 }
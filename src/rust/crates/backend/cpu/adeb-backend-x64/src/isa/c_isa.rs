@@ -83,7 +83,8 @@ pub fn c99_sizeof(ty: &Type) -> i32 {
 
 /// Compute C99-compliant field alignment for a given size.
 /// MSVC x64: alignment = min(sizeof(field), 8)
-pub fn c99_align(size: i32) -> i32 {
+#[inline]
+pub const fn c99_align(size: i32) -> i32 {
     match size {
         0 => 1,
         1 => 1,
@@ -94,7 +95,8 @@ pub fn c99_align(size: i32) -> i32 {
 }
 
 /// Align an offset to the given alignment boundary.
-pub fn align_to(offset: i32, align: i32) -> i32 {
+#[inline]
+pub const fn align_to(offset: i32, align: i32) -> i32 {
     if align <= 1 {
         return offset;
     }
@@ -11,14 +11,16 @@
 
 use crate::iat_registry;
 
-fn align_up_u32(v: u32, a: u32) -> u32 {
+#[inline]
+const fn align_up_u32(v: u32, a: u32) -> u32 {
     if a == 0 {
         return v;
     }
     (v + (a - 1)) & !(a - 1)
 }
 
-fn align_up_usize(v: usize, a: usize) -> usize {
+#[inline]
+const fn align_up_usize(v: usize, a: usize) -> usize {
     if a == 0 {
         return v;
     }
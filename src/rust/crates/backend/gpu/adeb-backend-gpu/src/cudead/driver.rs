@@ -11,7 +11,8 @@
 // - CPU↔GPU Sync (~10KB)   → Sincronización
 // ============================================================
 
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
+use std::time::Duration;
 
 // ============================================================
 // PCIe Layer (~5KB)
@@ -199,6 +200,10 @@ pub struct VramBlock {
     pub alignment: usize,
 }
 
+/// VRAM allocation granularity: sizes are rounded up to a multiple of this
+/// so freed blocks can be reused by requests of similar size
+pub const VRAM_GRANULARITY: usize = 256;
+
 /// VRAM allocator with free list
 pub struct VramAllocator {
     base: u64,
@@ -219,76 +224,120 @@ impl VramAllocator {
                 addr: base,
                 size: total_size,
                 free: true,
-                alignment: 256,
+                alignment: VRAM_GRANULARITY,
             }],
             allocations: HashMap::new(),
         }
     }
 
-    /// Allocate VRAM with alignment
+    /// Allocate VRAM with alignment.
+    /// `alignment` must be 0 or a power of two (otherwise `None`); it is raised to
+    /// at least `VRAM_GRANULARITY` (256 B, same as cudaMalloc).
     pub fn alloc(&mut self, size: usize, alignment: usize) -> Option<u64> {
+        let size = Self::round_size(size)?;
+        if alignment != 0 && !alignment.is_power_of_two() {
+            return None;
+        }
+        let alignment = alignment.max(VRAM_GRANULARITY);
+
         // Find first fit
-        for block in &mut self.blocks {
-            if block.free && block.size >= size {
-                // Align address
-                let aligned_addr =
-                    (block.addr + alignment as u64 - 1) & !(alignment as u64 - 1);
-                let padding = (aligned_addr - block.addr) as usize;
-                let total_needed = size + padding;
-
-                if block.size >= total_needed {
-                    // Split block
-                    let remaining = block.size - total_needed;
-                    block.free = false;
-                    block.size = total_needed;
-
-                    if remaining > 0 {
-                        self.blocks.push(VramBlock {
-                            addr: aligned_addr + size as u64,
-                            size: remaining,
-                            free: true,
-                            alignment: 256,
-                        });
-                    }
-
-                    self.used_size += total_needed;
-                    self.allocations.insert(
-                        aligned_addr,
-                        VramBlock {
-                            addr: aligned_addr,
-                            size,
-                            free: false,
-                            alignment,
-                        },
-                    );
-
-                    return Some(aligned_addr);
-                }
+        for i in 0..self.blocks.len() {
+            let block = &self.blocks[i];
+            if !block.free || block.size < size {
+                continue;
+            }
+
+            // Align address
+            let aligned_addr = match block.addr.checked_add(alignment as u64 - 1) {
+                Some(end) => end & !(alignment as u64 - 1),
+                None => continue,
+            };
+            let padding = (aligned_addr - block.addr) as usize;
+            if block.size.saturating_sub(padding) < size {
+                continue;
+            }
+
+            // Split block in place: [free padding][allocated][free remainder]
+            // (blocks stay sorted by address)
+            let (block_addr, remaining) = (block.addr, block.size - size - padding);
+            let mut idx = i;
+            self.blocks[i] = VramBlock {
+                addr: aligned_addr,
+                size,
+                free: false,
+                alignment,
+            };
+            if padding > 0 {
+                self.blocks.insert(
+                    i,
+                    VramBlock {
+                        addr: block_addr,
+                        size: padding,
+                        free: true,
+                        alignment: VRAM_GRANULARITY,
+                    },
+                );
+                idx = i + 1;
+            }
+            if remaining > 0 {
+                self.blocks.insert(
+                    idx + 1,
+                    VramBlock {
+                        addr: aligned_addr + size as u64,
+                        size: remaining,
+                        free: true,
+                        alignment: VRAM_GRANULARITY,
+                    },
+                );
             }
+
+            self.used_size += size;
+            self.allocations.insert(aligned_addr, self.blocks[idx].clone());
+
+            return Some(aligned_addr);
         }
         None
     }
 
+    /// Round a request up to the allocation granularity (`None` on overflow)
+    #[inline]
+    pub fn round_size(size: usize) -> Option<usize> {
+        Some(size.max(1).checked_add(VRAM_GRANULARITY - 1)? & !(VRAM_GRANULARITY - 1))
+    }
+
     /// Free VRAM
     pub fn free(&mut self, addr: u64) -> bool {
         if let Some(block) = self.allocations.remove(&addr) {
             self.used_size -= block.size;
 
-            // Mark block as free
-            for b in &mut self.blocks {
-                if b.addr == addr {
-                    b.free = true;
-                    break;
-                }
+            // Mark block as free and merge it with its neighbours
+            if let Ok(i) = self.blocks.binary_search_by_key(&addr, |b| b.addr) {
+                self.blocks[i].free = true;
+                self.coalesce_at(i);
             }
-
-            // TODO: Coalesce adjacent free blocks
             true
         } else {
             false
         }
     }
 
+    /// Merge block `i` with its adjacent free neighbours to limit fragmentation
+    fn coalesce_at(&mut self, i: usize) {
+        if i + 1 < self.blocks.len() && Self::mergeable(&self.blocks[i], &self.blocks[i + 1]) {
+            let next = self.blocks.remove(i + 1);
+            self.blocks[i].size += next.size;
+        }
+        if i > 0 && Self::mergeable(&self.blocks[i - 1], &self.blocks[i]) {
+            let cur = self.blocks.remove(i);
+            self.blocks[i - 1].size += cur.size;
+        }
+    }
+
+    #[inline]
+    fn mergeable(a: &VramBlock, b: &VramBlock) -> bool {
+        a.free && b.free && a.addr + a.size as u64 == b.addr
+    }
+
     /// Get usage stats
     pub fn stats(&self) -> (usize, usize) {
         (self.used_size, self.total_size)
@@ -316,6 +365,12 @@ pub struct KernelJob {
     pub priority: i32,
 }
 
+/// Ceiling division without overflow (u32::div_ceil needs Rust 1.73)
+#[inline]
+const fn ceil_div(n: u32, d: u32) -> u32 {
+    n / d + (n % d != 0) as u32
+}
+
 /// GPU scheduler
 pub struct GpuScheduler {
     sm_count: u32,
@@ -345,19 +400,9 @@ impl GpuScheduler {
 
     /// Schedule pending jobs
     pub fn schedule(&mut self) -> Vec<KernelJob> {
-        // Simple FIFO scheduling
-        let mut scheduled = Vec::new();
-
-        while let Some(job) = self.job_queue.pop() {
-            // Check if we have resources
-            let threads_needed = job.block.0 * job.block.1 * job.block.2;
-            let blocks_needed = job.grid.0 * job.grid.1 * job.grid.2;
-
-            // Simplified: just schedule everything
-            scheduled.push(job.clone());
-            self.active_jobs.push(job);
-        }
-
+        // Simple FIFO scheduling: dispatch the whole queue in submission order
+        let scheduled: Vec<KernelJob> = self.job_queue.drain(..).collect();
+        self.active_jobs.extend_from_slice(&scheduled);
         scheduled
     }
 
@@ -367,6 +412,16 @@ impl GpuScheduler {
         self.completed_jobs += 1;
     }
 
+    /// Mark a whole batch as completed with a single pass over active jobs
+    pub fn complete_batch(&mut self, jobs: &[KernelJob]) {
+        if jobs.is_empty() {
+            return;
+        }
+        let names: HashSet<&str> = jobs.iter().map(|j| j.kernel_name.as_str()).collect();
+        self.active_jobs.retain(|j| !names.contains(j.kernel_name.as_str()));
+        self.completed_jobs += jobs.len();
+    }
+
     /// Get occupancy estimate
     pub fn estimate_occupancy(&self, block_size: u32, shared_memory: usize) -> f32 {
         let warps_per_block = (block_size + self.warp_size - 1) / self.warp_size;
@@ -384,6 +439,51 @@ impl GpuScheduler {
         actual_warps as f32 / max_warps_per_sm as f32
     }
 
+    /// Choose (grid, block) for a 1D launch of `total_threads` threads.
+    /// Blocks are power-of-two multiples of the warp size, starting at one warp;
+    /// a larger block is taken only if occupancy does not drop and the grid still
+    /// has at least one block per SM, so small launches spread across the SMs.
+    pub fn choose_launch_dims(&self, total_threads: u32, shared_memory: usize) -> (u32, u32) {
+        const MAX_BLOCK_SIZE: u32 = 1024;
+
+        let mut best_block = self.warp_size;
+        let mut best_occupancy = self.estimate_occupancy(best_block, shared_memory);
+        let mut block = best_block * 2;
+        while block <= MAX_BLOCK_SIZE {
+            let grid = ceil_div(total_threads, block);
+            let occupancy = self.estimate_occupancy(block, shared_memory);
+            if occupancy >= best_occupancy && grid >= self.sm_count {
+                best_block = block;
+                best_occupancy = occupancy;
+            }
+            block *= 2;
+        }
+
+        let grid = ceil_div(total_threads, best_block).max(1);
+        (grid, best_block)
+    }
+
+    /// Submit a 1D kernel, choosing grid/block with `choose_launch_dims`
+    pub fn submit_auto(
+        &mut self,
+        kernel_name: &str,
+        total_threads: u32,
+        shared_memory: usize,
+        args: Vec<u64>,
+        stream: u32,
+    ) {
+        let (grid, block) = self.choose_launch_dims(total_threads, shared_memory);
+        self.submit(KernelJob {
+            kernel_name: kernel_name.to_string(),
+            grid: (grid, 1, 1),
+            block: (block, 1, 1),
+            shared_memory,
+            args,
+            stream,
+            priority: 0,
+        });
+    }
+
     /// Get stats
     pub fn stats(&self) -> (usize, usize, usize) {
         (
@@ -418,12 +518,27 @@ impl GpuFence {
         self.signaled = true;
     }
 
+    /// Consume the signal.
+    ///
+    /// # Panics
+    /// Panics if the fence has not been signaled: nothing else can signal it
+    /// while this call holds `&mut self`, so waiting would never return.
     pub fn wait(&mut self) {
-        // In real implementation, this would spin or sleep
-        while !self.signaled {
-            std::hint::spin_loop();
+        assert!(
+            self.wait_timeout(Duration::ZERO),
+            "GpuFence::wait on an unsignaled fence would never return"
+        );
+    }
+
+    /// Consume the signal if present and return true.
+    /// An unsignaled fence cannot become signaled while `&mut self` is held,
+    /// so this returns false immediately instead of sleeping out `_timeout`.
+    pub fn wait_timeout(&mut self, _timeout: Duration) -> bool {
+        if self.signaled {
+            self.signaled = false;
+            return true;
         }
-        self.signaled = false;
+        false
     }
 
     pub fn is_signaled(&self) -> bool {
@@ -454,11 +569,18 @@ impl GpuStream {
         }
     }
 
+    /// Record an op on this stream. The simulated device completes work
+    /// synchronously, so the op is already done and the stream fence is signaled.
     pub fn record_op(&mut self) {
         self.pending_ops += 1;
+        self.fence.signal();
     }
 
     pub fn sync(&mut self) {
+        // Nothing in flight, nothing to wait for
+        if self.pending_ops == 0 {
+            return;
+        }
         self.fence.wait();
         self.pending_ops = 0;
     }
@@ -536,8 +658,13 @@ pub struct CudeadDriver {
 }
 
 impl CudeadDriver {
-    /// Initialize driver
+    /// Initialize driver without printing
     pub fn init() -> Result<Self, super::CudeadError> {
+        Self::init_with(false)
+    }
+
+    /// Initialize driver; when `verbose`, print the device summary
+    pub fn init_with(verbose: bool) -> Result<Self, super::CudeadError> {
         // Scan for NVIDIA GPUs
         let devices = PCIeScanner::scan_nvidia();
 
@@ -550,13 +677,15 @@ impl CudeadDriver {
         let device = devices[0].clone();
         let nvidia_device = device.nvidia_device();
 
-        println!("[CUDead-BIB] Found GPU: {}", nvidia_device.name());
-        println!("[CUDead-BIB] VRAM: {} MB", nvidia_device.vram_mb());
-        println!("[CUDead-BIB] SMs: {}", nvidia_device.sm_count());
-        println!(
-            "[CUDead-BIB] Architecture: {}",
-            nvidia_device.architecture().name()
-        );
+        if verbose {
+            println!("[CUDead-BIB] Found GPU: {}", nvidia_device.name());
+            println!("[CUDead-BIB] VRAM: {} MB", nvidia_device.vram_mb());
+            println!("[CUDead-BIB] SMs: {}", nvidia_device.sm_count());
+            println!(
+                "[CUDead-BIB] Architecture: {}",
+                nvidia_device.architecture().name()
+            );
+        }
 
         let vram = VramAllocator::new(device.bar1, nvidia_device.vram_mb() as usize);
         let scheduler = GpuScheduler::new(nvidia_device);
@@ -603,13 +732,24 @@ impl CudeadDriver {
         self.scheduler.submit(job);
     }
 
+    /// Submit a 1D kernel over `total_threads`; grid/block are chosen by occupancy
+    pub fn launch_kernel(
+        &mut self,
+        kernel_name: &str,
+        total_threads: u32,
+        shared_memory: usize,
+        args: Vec<u64>,
+        stream: u32,
+    ) {
+        self.scheduler
+            .submit_auto(kernel_name, total_threads, shared_memory, args, stream);
+    }
+
     /// Execute pending kernels
     pub fn execute(&mut self) {
         let jobs = self.scheduler.schedule();
-        for job in jobs {
-            // In real implementation, this would dispatch to GPU
-            self.scheduler.complete(&job.kernel_name);
-        }
+        // In real implementation, this would dispatch to GPU as one submission
+        self.scheduler.complete_batch(&jobs);
     }
 
     /// Synchronize
@@ -643,6 +783,67 @@ mod tests {
         assert!(alloc.free(ptr));
     }
 
+    #[test]
+    fn test_vram_allocator_rounds_to_granularity() {
+        assert_eq!(VramAllocator::round_size(0), Some(VRAM_GRANULARITY));
+        assert_eq!(VramAllocator::round_size(100), Some(256));
+        assert_eq!(VramAllocator::round_size(257), Some(512));
+        assert_eq!(VramAllocator::round_size(usize::MAX), None);
+
+        let mut alloc = VramAllocator::new(0x1000_0000, 1);
+        let a = alloc.alloc(100, 256).unwrap();
+        let b = alloc.alloc(1, 256).unwrap();
+        assert_eq!(b - a, 256);
+        assert_eq!(alloc.stats().0, 512);
+    }
+
+    #[test]
+    fn test_vram_allocator_oversized_request() {
+        let mut alloc = VramAllocator::new(0x1000_0000, 1);
+        assert_eq!(alloc.alloc(usize::MAX, 256), None);
+        assert_eq!(alloc.alloc(usize::MAX - 100, 256), None);
+        assert_eq!(alloc.stats().0, 0);
+    }
+
+    #[test]
+    fn test_vram_allocator_alignment() {
+        let mut alloc = VramAllocator::new(0x1000_0000, 1);
+        let a = alloc.alloc(64, 16).unwrap();
+        assert_eq!(a % VRAM_GRANULARITY as u64, 0);
+
+        // The requested alignment is honoured and the block is freed by its aligned address
+        let b = alloc.alloc(64, 4096).unwrap();
+        assert_eq!(b % 4096, 0);
+        assert!(alloc.blocks.windows(2).all(|w| w[0].addr < w[1].addr));
+        assert!(alloc.free(b));
+        assert!(alloc.free(a));
+        assert_eq!(alloc.stats().0, 0);
+
+        // Non-power-of-two or impossible alignments fail like a request that does not fit
+        assert_eq!(alloc.alloc(64, 300), None);
+        assert_eq!(alloc.alloc(64, usize::MAX), None);
+        assert_eq!(alloc.alloc(64, 1 << (usize::BITS - 1)), None);
+        assert_eq!(alloc.alloc(64, 0).map(|p| p % VRAM_GRANULARITY as u64), Some(0));
+    }
+
+    #[test]
+    fn test_vram_allocator_coalesce() {
+        let mut alloc = VramAllocator::new(0x1000_0000, 1);
+        let a = alloc.alloc(1024, 256).unwrap();
+        let b = alloc.alloc(1024, 256).unwrap();
+        let _c = alloc.alloc(1024, 256).unwrap();
+        assert!(alloc.free(b));
+        assert!(alloc.free(a));
+
+        // a and b are merged: a 2KB block fits again at a's address
+        assert_eq!(alloc.alloc(2048, 256), Some(a));
+
+        let mut alloc = VramAllocator::new(0x1000_0000, 1);
+        let a = alloc.alloc(4096, 256).unwrap();
+        assert!(alloc.free(a));
+        assert_eq!(alloc.blocks.len(), 1);
+    }
+
     #[test]
     fn test_scheduler() {
         let mut sched = GpuScheduler::new(NvidiaDevice::RTX3060);
@@ -656,8 +857,50 @@ mod tests {
             priority: 0,
         });
 
+        sched.submit(KernelJob {
+            kernel_name: "second".to_string(),
+            grid: (1, 1, 1),
+            block: (32, 1, 1),
+            shared_memory: 0,
+            args: vec![],
+            stream: 0,
+            priority: 0,
+        });
+
         let jobs = sched.schedule();
-        assert_eq!(jobs.len(), 1);
+        assert_eq!(jobs.len(), 2);
+        assert_eq!(jobs[0].kernel_name, "test");
+        assert_eq!(sched.stats(), (0, 2, 0));
+
+        sched.complete_batch(&jobs);
+        assert_eq!(sched.stats(), (0, 0, 2));
+    }
+
+    #[test]
+    fn test_choose_launch_dims() {
+        let sched = GpuScheduler::new(NvidiaDevice::RTX3060); // 28 SMs
+
+        // Large launch: 1024-thread blocks still fill every SM
+        assert_eq!(sched.choose_launch_dims(1 << 20, 0), (1024, 1024));
+        // 28 * 256 threads: 256 is the largest block that keeps one block per SM
+        assert_eq!(sched.choose_launch_dims(28 * 256, 0), (28, 256));
+        // Small launches shrink the block towards one warp to use more SMs
+        assert_eq!(sched.choose_launch_dims(3000, 0), (47, 64));
+        assert_eq!(sched.choose_launch_dims(1000, 0), (32, 32));
+        assert_eq!(sched.choose_launch_dims(100, 0), (4, 32));
+        assert_eq!(sched.choose_launch_dims(0, 0), (1, 32));
+        // No overflow near u32::MAX
+        assert_eq!(sched.choose_launch_dims(u32::MAX, 0), (4_194_304, 1024));
+    }
+
+    #[test]
+    fn test_submit_auto() {
+        let mut sched = GpuScheduler::new(NvidiaDevice::RTX3060);
+        sched.submit_auto("saxpy", 28 * 256, 0, vec![], 0);
+
+        let jobs = sched.schedule();
+        assert_eq!(jobs[0].grid, (28, 1, 1));
+        assert_eq!(jobs[0].block, (256, 1, 1));
     }
 
     #[test]
@@ -666,5 +909,44 @@ mod tests {
         let stream = sync.create_stream();
         assert_eq!(stream, 1);
         sync.destroy_stream(stream);
+
+        // Streams with no pending ops sync without waiting on their fence
+        sync.sync_device();
+    }
+
+    #[test]
+    fn test_stream_sync_after_record_op() {
+        let mut stream = GpuStream::new(1);
+        stream.record_op();
+        stream.record_op();
+        stream.sync();
+        assert_eq!(stream.pending_ops, 0);
+        assert!(!stream.fence.is_signaled());
+
+        let mut sync = SyncManager::new();
+        let id = sync.create_stream();
+        sync.streams.get_mut(&id).unwrap().record_op();
+        sync.sync_stream(id);
+        sync.sync_device();
+    }
+
+    #[test]
+    #[should_panic(expected = "unsignaled fence")]
+    fn test_fence_wait_unsignaled_panics() {
+        GpuFence::new().wait();
+    }
+
+    #[test]
+    fn test_fence_wait_timeout() {
+        let mut fence = GpuFence::new();
+        // Returns at once rather than sleeping out the timeout
+        let start = std::time::Instant::now();
+        assert!(!fence.wait_timeout(Duration::from_secs(5)));
+        assert!(start.elapsed() < Duration::from_secs(1));
+
+        fence.signal();
+        assert!(fence.wait_timeout(Duration::from_millis(1)));
+        assert!(!fence.is_signaled());
+        assert_eq!(fence.value, 1);
     }
 }
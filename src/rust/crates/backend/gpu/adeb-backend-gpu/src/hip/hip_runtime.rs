@@ -11,7 +11,8 @@
 // ============================================================
 
 use std::path::Path;
-use std::process::Command;
+use std::process::{Command, Stdio};
+use std::sync::OnceLock;
 
 /// Estado del runtime HIP
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
@@ -65,8 +66,15 @@ impl Default for HipDeviceInfo {
     }
 }
 
+/// Backend detectado (se sondea el sistema de archivos una sola vez por proceso)
+static HIP_BACKEND: OnceLock<HipBackend> = OnceLock::new();
+
 /// Detecta el backend HIP disponible
 pub fn detect_hip_backend() -> HipBackend {
+    *HIP_BACKEND.get_or_init(probe_hip_backend)
+}
+
+fn probe_hip_backend() -> HipBackend {
     // 1. Verificar CUDA (NVIDIA)
     if detect_cuda_available() {
         return HipBackend::Cuda;
@@ -110,11 +118,16 @@ fn detect_rocm_available() -> bool {
     }
 }
 
+/// Info del dispositivo (nvidia-smi/rocm-smi se lanzan una sola vez por proceso)
+static HIP_DEVICE_INFO: OnceLock<HipDeviceInfo> = OnceLock::new();
+
 /// Obtiene información del dispositivo
 pub fn get_device_info() -> HipDeviceInfo {
-    let backend = detect_hip_backend();
+    HIP_DEVICE_INFO.get_or_init(query_device_info).clone()
+}
 
-    match backend {
+fn query_device_info() -> HipDeviceInfo {
+    match detect_hip_backend() {
         HipBackend::Cuda => get_cuda_device_info(),
         HipBackend::Rocm => get_rocm_device_info(),
         HipBackend::Cpu => get_cpu_device_info(),
@@ -129,6 +142,7 @@ fn get_cuda_device_info() -> HipDeviceInfo {
             "--query-gpu=name,memory.total",
             "--format=csv,noheader,nounits",
         ])
+        .stderr(Stdio::null())
         .output();
 
     match output {
@@ -167,6 +181,7 @@ fn get_rocm_device_info() -> HipDeviceInfo {
     // Usar rocm-smi para obtener info
     let output = Command::new("rocm-smi")
         .args(["--showproductname"])
+        .stderr(Stdio::null())
         .output();
 
     match output {
@@ -384,11 +384,13 @@ impl BytecodeToSpirV {
         self.emit(SpirVOp::OpReturn, &[]);
         self.emit(SpirVOp::OpFunctionEnd, &[]);
 
-        // Build final SPIR-V
-        let mut spirv = self.generate_header();
-        spirv.extend_from_slice(&self.instructions);
-
-        spirv.iter().flat_map(|w| w.to_le_bytes()).collect()
+        // Build final SPIR-V: buffer de bytes con capacidad exacta (múltiplo de 4)
+        let header = self.generate_header();
+        let mut spirv = Vec::with_capacity((header.len() + self.instructions.len()) * 4);
+        for word in header.iter().chain(&self.instructions) {
+            spirv.extend_from_slice(&word.to_le_bytes());
+        }
+        spirv
     }
 
     /// Compila una instrucción individual
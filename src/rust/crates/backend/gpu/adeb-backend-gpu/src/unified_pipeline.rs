@@ -14,7 +14,7 @@
 use super::gpu_detect::{GPUFeatures, GPUVendor};
 use super::hex::{GpuOpcode, HexGenerator};
 use crate::runtime::gpu_dispatcher::{DataLocation, ExecutionTarget, GpuDispatcher, OperationCost};
-use std::process::Command;
+use std::process::{Command, Stdio};
 
 // ============================================================================
 // DETECCIÓN DETALLADA DE HARDWARE
@@ -73,6 +73,7 @@ impl GpuRuntimeState {
                 "--query-gpu=memory.total,memory.free,memory.used,temperature.gpu,utilization.gpu,utilization.memory,power.draw,power.limit,clocks.current.graphics,clocks.current.memory",
                 "--format=csv,noheader,nounits"
             ])
+            .stderr(Stdio::null())
             .output();
 
         if let Ok(output) = output {
@@ -17,6 +17,19 @@ use super::glsl::{ShaderStage, ShaderSource};
 // Shader format detection
 // =========================================================================
 
+/// SPIR-V magic number (little-endian word 0 of every module)
+pub const SPIRV_MAGIC: u32 = 0x0723_0203;
+
+/// DXBC container magic ("DXBC" read as a little-endian u32)
+const DXBC_MAGIC: u32 = u32::from_le_bytes(*b"DXBC");
+
+/// Read the first 4 bytes as a little-endian u32 (one load + one compare per magic)
+#[inline]
+fn header_word(data: &[u8]) -> Option<u32> {
+    let bytes: [u8; 4] = data.get(..4)?.try_into().ok()?;
+    Some(u32::from_le_bytes(bytes))
+}
+
 /// All shader formats that OpenGL can consume via ADead-BIB
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
 pub enum ShaderFormat {
@@ -48,15 +61,11 @@ impl ShaderFormat {
 
     /// Detect format from binary magic bytes
     pub fn from_magic(data: &[u8]) -> Option<Self> {
-        if data.len() < 4 {
-            return None;
-        }
-        // SPIR-V magic: 0x07230203
-        if data[0] == 0x03 && data[1] == 0x02 && data[2] == 0x23 && data[3] == 0x07 {
+        let magic = header_word(data)?;
+        if magic == SPIRV_MAGIC {
             return Some(ShaderFormat::SpirV);
         }
-        // DXBC magic: "DXBC"
-        if data[0] == b'D' && data[1] == b'X' && data[2] == b'B' && data[3] == b'C' {
+        if magic == DXBC_MAGIC {
             return Some(ShaderFormat::Dxbc);
         }
         // PTX starts with ".version"
@@ -113,11 +122,7 @@ impl SpirVShader {
 
     /// Validate SPIR-V magic number
     pub fn validate_magic(&self) -> bool {
-        self.bytecode.len() >= 4
-            && self.bytecode[0] == 0x03
-            && self.bytecode[1] == 0x02
-            && self.bytecode[2] == 0x23
-            && self.bytecode[3] == 0x07
+        header_word(&self.bytecode) == Some(SPIRV_MAGIC)
     }
 
     /// Word count (SPIR-V is u32-aligned)